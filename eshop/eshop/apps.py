@@ -0,0 +1,90 @@
+import sys
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+
+from django.apps import AppConfig
+from django.conf import settings
+
+from .log_utils import AppendHandler, LogFileHandler, TimedMemoryHandler
+
+LOG_BUFFER_CAPACITY = 1024
+LOG_FLUSH_INTERVAL = 30.0
+SERVICE_LOGGER = "eshop.services.product_service"
+
+_listener = None
+
+
+def configure_service_logging():
+    """
+    Attach a QueueHandler to the product service logger and start the QueueListener
+    that drains it into the console and log-file handlers, so request threads never
+    block on log I/O. File writes are buffered and flushed in batches, immediately
+    for ERROR and above. Handlers are built directly rather than through dictConfig.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter(settings.LOG_FORMAT)
+
+    console_handler = logging.StreamHandler()
+    # Development keeps a rotation-aware stream; production appends with raw os.write
+    if settings.DEBUG:
+        file_handler = LogFileHandler(settings.LOG_FILE, delay=True)
+    else:
+        file_handler = AppendHandler(settings.LOG_FILE)
+    file_handler.setLevel(logging.INFO)
+    for handler in (console_handler, file_handler):
+        handler.setFormatter(formatter)
+
+    buffered_file_handler = TimedMemoryHandler(
+        LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flush_interval=LOG_FLUSH_INTERVAL,
+    )
+    buffered_file_handler.setLevel(logging.INFO)
+    atexit.register(buffered_file_handler.flush)
+
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(
+        log_queue, console_handler, buffered_file_handler, respect_handler_level=True
+    )
+    _listener.start()
+    # atexit runs in reverse order: drain the queue first, then flush the buffer
+    atexit.register(_listener.stop)
+
+    logger = logging.getLogger(SERVICE_LOGGER)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return _listener
+
+
+def init_sentry():
+    """Initialize the Sentry SDK; imported here so non-serving commands skip its cost."""
+    if sys.argv[1:2] and sys.argv[1] in settings.SENTRY_SKIP_COMMANDS:
+        return
+
+    import sentry_sdk
+    from sentry_sdk.integrations.django import DjangoIntegration
+
+    sentry_sdk.init(
+        dsn=settings.SENTRY_DSN,
+        integrations=[DjangoIntegration()],
+        traces_sample_rate=settings.SENTRY_TRACES_SAMPLE_RATE,
+        environment=settings.SENTRY_ENVIRONMENT,
+        release=settings.SENTRY_RELEASE,
+        send_default_pii=True,
+    )
+
+
+class EshopConfig(AppConfig):
+    name = "eshop"
+
+    def ready(self):
+        """Start background log writing and error reporting once the app registry is ready."""
+        configure_service_logging()
+        init_sentry()
@@ -1,8 +1,10 @@
-import json
-import uuid
 import redis
+import orjson
+import socket
+import hashlib
 import decimal
 import threading
+import zstandard as zstd
 import functools
 import logging
 
@@ -11,7 +13,8 @@ from redis.exceptions import ConnectionError, TimeoutError
 
 """
 Redis utility module: provides a singleton Redis client,
-JSON encoding for UUID and Decimal, and safe cache operations
+orjson encoding with Decimal fallback and zstd compression of
+large payloads, and safe cache operations
 with automatic exception handling.
 """
 
@@ -21,26 +24,67 @@ try:
 except ImportError:
     RedisDownExceptions = (ConnectionError, TimeoutError)
 
-_lock = threading.Lock()
+SCAN_COUNT = 1000
+UNLINK_BATCH_SIZE = 500
+
+COMPRESS_THRESHOLD = 1024
+COMPRESS_LEVEL = 3
+RAW_MAGIC = b"j\x01"
+ZSTD_MAGIC = b"z\x01"
+
+HEALTH_CHECK_INTERVAL = 30
+SOCKET_TIMEOUT = 0.5
+KEEPALIVE_OPTIONS = {
+    opt: val
+    for opt, val in (
+        (getattr(socket, "TCP_KEEPIDLE", None), 60),
+        (getattr(socket, "TCP_KEEPINTVL", None), 10),
+        (getattr(socket, "TCP_KEEPCNT", None), 3),
+    )
+    if opt is not None
+}
+
+_pools = {}
+
+
+def _pool_from_url(redis_url):
+    """Return the bounded connection pool for a Redis URL, creating it on first use."""
+    pool = _pools.get(redis_url)
+    if pool is None:
+        pool = redis.BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=settings.REDIS_POOL_SIZE,
+            socket_keepalive=True,
+            socket_keepalive_options=KEEPALIVE_OPTIONS,
+            health_check_interval=HEALTH_CHECK_INTERVAL,
+            socket_timeout=SOCKET_TIMEOUT,
+            # Fail fast when the pool is exhausted instead of blocking for the 20s default
+            timeout=SOCKET_TIMEOUT,
+            decode_responses=False,
+        )
+        _pools[redis_url] = pool
+    return pool
 
 
 class SingletonRedisClient:
-    """Singleton pattern for Redis client initialization."""
+    """Singleton pattern for Redis client initialization; instances are built once at import."""
     _instances = {}
 
-    def __new__(cls, mode="read"):  
-        """Instantiate or return existing Redis client for given mode."""
-        with _lock:
-            if mode not in cls._instances:
-                instance = super(SingletonRedisClient, cls).__new__(cls)
-                instance.init_client(mode)
-                cls._instances[mode] = instance
-            return cls._instances[mode]
+    def __new__(cls, mode="read"):
+        """Return the prebuilt Redis client for the given mode, without locking."""
+        return cls._instances["read" if mode == "read" else "write"]
+
+    @classmethod
+    def _build(cls, mode):
+        """Instantiate and initialize the client for a mode."""
+        instance = super(SingletonRedisClient, cls).__new__(cls)
+        instance.init_client(mode)
+        return instance
 
     def init_client(self, mode):
-        """Initialize Redis client using read or write URL from settings."""
+        """Initialize Redis client on the shared pool for the read or write URL from settings."""
         redis_url = settings.REDIS_READ_URL if mode == "read" else settings.REDIS_WRITE_URL
-        self.client = redis.StrictRedis.from_url(redis_url, decode_responses=True)
+        self.client = redis.StrictRedis(connection_pool=_pool_from_url(redis_url))
 
     def get_client(self):
         """Retrieve the underlying Redis client instance."""
@@ -49,15 +93,64 @@ class SingletonRedisClient:
         return self.client
 
 
-class EnhancedJSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder handling UUID and Decimal serialization."""
-    def default(self, obj):
-        """Convert UUID to str and Decimal to float."""
-        if isinstance(obj, uuid.UUID):
-            return str(obj)
-        if isinstance(obj, decimal.Decimal):
-            return float(obj)
-        return super().default(obj)
+SingletonRedisClient._instances = {
+    mode: SingletonRedisClient._build(mode) for mode in ("read", "write")
+}
+_READ_CLIENT = SingletonRedisClient("read").get_client()
+_WRITE_CLIENT = SingletonRedisClient("write").get_client()
+
+
+def _default(obj):
+    """
+    Convert Decimal to float, as the API renderer does (COERCE_DECIMAL_TO_STRING is off);
+    UUIDs and datetimes are encoded natively by orjson.
+    """
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_zstd = threading.local()
+
+
+def _compressor():
+    """Return this thread's zstd compressor; contexts are not safe to share across threads."""
+    cctx = getattr(_zstd, "cctx", None)
+    if cctx is None:
+        cctx = _zstd.cctx = zstd.ZstdCompressor(level=COMPRESS_LEVEL)
+    return cctx
+
+
+def _decompressor():
+    """Return this thread's zstd decompressor."""
+    dctx = getattr(_zstd, "dctx", None)
+    if dctx is None:
+        dctx = _zstd.dctx = zstd.ZstdDecompressor()
+    return dctx
+
+
+def _dumps(value):
+    """Serialize a value to tagged JSON bytes, zstd-compressing payloads above the threshold."""
+    raw = orjson.dumps(value, default=_default)
+    if len(raw) > COMPRESS_THRESHOLD:
+        return ZSTD_MAGIC + _compressor().compress(raw)
+    return RAW_MAGIC + raw
+
+
+def content_etag(value):
+    """Return a short, stable blake2b digest of a value's JSON encoding for use as an ETag."""
+    raw = orjson.dumps(value, default=_default, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def _loads(data):
+    """Deserialize bytes written by _dumps; untagged values are read as plain JSON."""
+    magic = data[:2]
+    if magic == ZSTD_MAGIC:
+        return orjson.loads(_decompressor().decompress(data[2:]))
+    if magic == RAW_MAGIC:
+        return orjson.loads(data[2:])
+    return orjson.loads(data)
 
 
 def log_redis_exceptions(logging_data, exception):
@@ -90,24 +183,86 @@ def redis_except(return_val=None):
 @redis_except(return_val=None)
 def get_cached(key):
     """Retrieve JSON-deserialized value from Redis for the given key."""
-    client = SingletonRedisClient("read").get_client()
+    client = _READ_CLIENT
     data = client.get(key)
-    return json.loads(data) if data else None
+    return _loads(data) if data else None
 
 
 @redis_except(return_val=False)
 def set_cached(key, value, ex=None):
     """Store a JSON-serializable value in Redis with optional expiry."""
-    client = SingletonRedisClient("write").get_client()
-    return client.set(key, json.dumps(value, cls=EnhancedJSONEncoder), ex=ex)
+    client = _WRITE_CLIENT
+    return client.set(key, _dumps(value), ex=ex)
+
+
+@redis_except(return_val=None)
+def get_many_cached(keys):
+    """Retrieve JSON-deserialized values for several keys in one MGET; misses are None."""
+    client = _READ_CLIENT
+    return [_loads(data) if data else None for data in client.mget(keys)]
+
+
+@redis_except(return_val=False)
+def set_many_cached(mapping, ex=None):
+    """Store several JSON-serializable values in one pipelined round-trip."""
+    client = _WRITE_CLIENT
+    pipe = client.pipeline(transaction=False)
+    for key, value in mapping.items():
+        pipe.set(key, _dumps(value), ex=ex)
+    return all(pipe.execute())
+
+
+@redis_except(return_val=False)
+def set_cached_indexed(key, value, ex, index_set, index_ex=None):
+    """
+    Store a JSON-serializable value and record its key in an index set, in one round-trip.
+    The index expires after index_ex (default: ex); keys cached with a shorter TTL than
+    their siblings should pass the longest sibling TTL so the index outlives them all.
+    """
+    client = _WRITE_CLIENT
+    pipe = client.pipeline(transaction=False)
+    pipe.set(key, _dumps(value), ex=ex)
+    pipe.sadd(index_set, key)
+    index_ex = ex if index_ex is None else index_ex
+    if index_ex is not None:
+        pipe.expire(index_set, index_ex)
+    return pipe.execute()[0]
+
+
+@redis_except(return_val=0)
+def invalidate_index(index_set, *keys):
+    """
+    Remove the given index set, unlink every key it recorded, and return deletion count.
+    The set is read and removed in one MULTI/EXEC, so keys indexed meanwhile land in a fresh set;
+    extra keys are unlinked in the same round-trip.
+    """
+    client = _WRITE_CLIENT
+    pipe = client.pipeline(transaction=True)
+    if keys:
+        pipe.unlink(*keys)
+    pipe.smembers(index_set)
+    pipe.unlink(index_set)
+    *deleted, members, _ = pipe.execute()
+    deleted_count = sum(deleted)
+    if members:
+        deleted_count += client.unlink(*members)
+    return deleted_count
 
 
 @redis_except(return_val=0)
 def invalidate(key_pattern):
-    """Delete all Redis keys matching the given pattern and return deletion count."""
-    client = SingletonRedisClient("write").get_client()
+    """Unlink all Redis keys matching the given pattern in pipelined batches and return deletion count."""
+    client = _WRITE_CLIENT
+    pipe = client.pipeline(transaction=False)
+    batch = []
     deleted_count = 0
-    for key in client.scan_iter(key_pattern):
-        client.delete(key)
-        deleted_count += 1
+    for key in client.scan_iter(match=key_pattern, count=SCAN_COUNT):
+        batch.append(key)
+        if len(batch) >= UNLINK_BATCH_SIZE:
+            pipe.unlink(*batch)
+            deleted_count += sum(pipe.execute())
+            batch.clear()
+    if batch:
+        pipe.unlink(*batch)
+        deleted_count += sum(pipe.execute())
     return deleted_count
@@ -0,0 +1,155 @@
+# eshop/log_utils.py
+
+import os
+import logging
+import threading
+from logging.handlers import MemoryHandler, WatchedFileHandler
+
+
+def _ensure_parent_dir(path):
+    """
+    Create the directory that will hold the given log file. Its parent (BASE_DIR)
+    always exists, so a single mkdir replaces the makedirs walk.
+    """
+    try:
+        os.mkdir(os.path.dirname(path))
+    except FileExistsError:
+        pass
+
+
+def _format_batch(handler, records):
+    """Format the records the handler's filters accept into one newline-terminated string."""
+    lines = []
+    for record in records:
+        if not handler.filter(record):
+            continue
+        try:
+            lines.append(handler.format(record) + handler.terminator)
+        except Exception:
+            handler.handleError(record)
+    return "".join(lines)
+
+
+class LogFileHandler(WatchedFileHandler):
+    """WatchedFileHandler that creates the log directory when the file is first opened."""
+    def _open(self):
+        """Ensure the parent directory exists, then open the stream."""
+        _ensure_parent_dir(self.baseFilename)
+        return super()._open()
+
+    def write_batch(self, records):
+        """Write several records with one stream write and one flush."""
+        data = _format_batch(self, records)
+        if not data:
+            return
+        self.acquire()
+        try:
+            self.reopenIfNeeded()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(data)
+            self.flush()
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+
+class AppendHandler(logging.Handler):
+    """
+    Handler that writes each formatted record with one unbuffered os.write on an
+    O_APPEND descriptor, so concurrent writers append atomically without flushes.
+    """
+    terminator = "\n"
+
+    def __init__(self, filename, mode=0o644, encoding="utf-8"):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.mode = mode
+        self.encoding = encoding
+        self._fd = None
+
+    def _open(self):
+        """Open the log file for appending, creating it and its directory if needed."""
+        _ensure_parent_dir(self.baseFilename)
+        return os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, self.mode)
+
+    def emit(self, record):
+        """Format the record and append it in a single write syscall."""
+        try:
+            msg = (self.format(record) + self.terminator).encode(self.encoding)
+            if self._fd is None:
+                self._fd = self._open()
+            os.write(self._fd, msg)
+        except Exception:
+            self.handleError(record)
+
+    def write_batch(self, records):
+        """Append several records with a single os.write of their joined lines."""
+        data = _format_batch(self, records).encode(self.encoding)
+        if not data:
+            return
+        self.acquire()
+        try:
+            if self._fd is None:
+                self._fd = self._open()
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view):]
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+    def close(self):
+        """Close the file descriptor if it was opened."""
+        self.acquire()
+        try:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            self.release()
+        super().close()
+
+
+class TimedMemoryHandler(MemoryHandler):
+    """
+    MemoryHandler that batches records for its target and flushes when the
+    buffer fills, on records at or above flushLevel, or every flush_interval seconds.
+    Targets with a write_batch(records) method receive the whole buffer in one call,
+    so a flush costs one write instead of one per record.
+    """
+    def __init__(self, capacity, flushLevel=logging.ERROR, target=None,
+                 flushOnClose=True, flush_interval=30.0):
+        super().__init__(capacity, flushLevel=flushLevel, target=target,
+                         flushOnClose=flushOnClose)
+        self.flush_interval = flush_interval
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self):
+        """Flush buffered records every flush_interval seconds until closed."""
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Hand the buffer to the target's write_batch if it has one, else record by record."""
+        self.acquire()
+        try:
+            write_batch = getattr(self.target, "write_batch", None)
+            if write_batch is None:
+                super().flush()
+            elif self.buffer:
+                write_batch(self.buffer)
+                self.buffer.clear()
+        finally:
+            self.release()
+
+    def close(self):
+        """Stop the periodic flush, then flush and close as MemoryHandler does."""
+        self._stopped.set()
+        super().close()
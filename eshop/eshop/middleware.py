@@ -8,14 +8,18 @@ logger = logging.getLogger("eshop.services.product_service")
 class RequestTimingMiddleware:
     """
     Logs each request’s method, path, status and duration,
-    but skips the Prometheus /metrics endpoint.
+    but skips Prometheus scrapes, health probes and static files.
     """
+    SKIP = ("/metrics", "/healthz", "/readyz", "/static/")
+
     def __init__(self, get_response):
         self.get_response = get_response
+        # Logging is configured before middleware loads, so the level check is done once
+        self.log_enabled = logger.isEnabledFor(logging.INFO)
 
     def __call__(self, request):
-        # Don’t log Prometheus scrapes
-        if request.path.startswith("/metrics"):
+        # Don’t time requests that won’t be logged
+        if not self.log_enabled or request.path.startswith(self.SKIP):
             return self.get_response(request)
 
         start = time.monotonic()
@@ -15,6 +15,9 @@ def get_db_query_count():
 
 from .metrics import PRODUCT_CACHE, PRODUCT_LATENCY
 
+# Bound (counter, histogram) children per (method, cache_hit), so the hot path skips label lookup
+_BOUND = {}
+
 def log_timing(func):
     def wrapper(*args, **kwargs):
         start = time.monotonic()
@@ -28,9 +31,16 @@ def log_timing(func):
         )
 
         # Prometheus
-        labels = {"method": func.__name__, "cache_hit": str(cache_hit)}
-        PRODUCT_CACHE.labels(**labels).inc()
-        PRODUCT_LATENCY.labels(**labels).observe(elapsed)
+        key = (func.__name__, cache_hit)
+        pair = _BOUND.get(key)
+        if pair is None:
+            labels = {"method": func.__name__, "cache_hit": str(cache_hit)}
+            pair = _BOUND[key] = (
+                PRODUCT_CACHE.labels(**labels),
+                PRODUCT_LATENCY.labels(**labels),
+            )
+        pair[0].inc()
+        pair[1].observe(elapsed)
 
         return data, cache_hit
     return wrapper
@@ -1,32 +1,61 @@
 import os
+import logging
 from pathlib import Path
 from dotenv import load_dotenv
 from django.core.exceptions import ImproperlyConfigured
 
 # ─── Load Environment ────────────────────────────────────────────────────
 BASE_DIR = Path(__file__).resolve().parent.parent
-load_dotenv(BASE_DIR / ".env")
-
-def get_env_var(name):
-    val = os.getenv(name)
+# Containers inject variables directly; only parse .env when one exists.
+# load_dotenv never overrides variables that are already set.
+_env_path = BASE_DIR / ".env"
+if _env_path.is_file():
+    load_dotenv(_env_path)
+
+# One-shot snapshot of the environment, taken after .env has been loaded
+_ENV = dict(os.environ)
+_MISSING = object()
+
+def env(name, default=_MISSING, cast=str):
+    """Read a variable from the environment snapshot, casting set values."""
+    val = _ENV.get(name)
     if not val:
-        raise ImproperlyConfigured(f"Missing required environment variable: {name}")
-    return val
+        if default is _MISSING:
+            raise ImproperlyConfigured(f"Missing required environment variable: {name}")
+        return default
+    return cast(val)
 
-# ─── Ensure logs directory exists ─────────────────────────────────────────
-LOG_DIR = os.path.join(BASE_DIR, "logs")
-os.makedirs(LOG_DIR, exist_ok=True)
+def get_env_var(name):
+    return env(name)
+
+# Validate all required variables up front so a misconfigured deploy reports every gap at once
+_REQUIRED = (
+    "DJANGO_SECRET_KEY",
+    "POSTGRES_DB",
+    "POSTGRES_USER",
+    "POSTGRES_PASSWORD",
+    "POSTGRES_HOST",
+    "REDIS_URL",
+    "SENTRY_DSN",
+)
+_missing = [name for name in _REQUIRED if not _ENV.get(name)]
+if _missing:
+    raise ImproperlyConfigured(
+        f"Missing required environment variables: {', '.join(_missing)}"
+    )
 
-print(f"[DEBUG] Log directory is: {LOG_DIR}")
-print(f"[DEBUG] Log file will be: {os.path.join(LOG_DIR, 'product_service.log')}")
+# ─── Log file location (directory is created on first write) ──────────────
+LOG_DIR = BASE_DIR / "logs"
+LOG_FILE = str(LOG_DIR / "product_service.log")
 
 # ─── Django Core ─────────────────────────────────────────────────────────
 SECRET_KEY = get_env_var("DJANGO_SECRET_KEY")
-DEBUG = os.getenv("DJANGO_DEBUG", "False") == "True"
-ALLOWED_HOSTS = os.getenv("DJANGO_ALLOWED_HOSTS", "localhost").split(",")
+DEBUG = env("DJANGO_DEBUG", "False") == "True"
+_hosts = env("DJANGO_ALLOWED_HOSTS", "localhost")
+ALLOWED_HOSTS = tuple(h.strip() for h in _hosts.split(",") if h.strip())
 
 # ─── Installed Apps ─────────────────────────────────────────────────────
-INSTALLED_APPS = [
+INSTALLED_APPS = (
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
@@ -34,11 +63,12 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "rest_framework",
+    "eshop.apps.EshopConfig",
     "products",
-]
+)
 
 # ─── Middleware ─────────────────────────────────────────────────────────
-MIDDLEWARE = [
+MIDDLEWARE = (
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -47,7 +77,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "eshop.middleware.RequestTimingMiddleware",
-]
+)
 
 # ─── URLs & App Config ──────────────────────────────────────────────────
 ROOT_URLCONF = "eshop.urls"
@@ -79,18 +109,37 @@ DATABASES = {
         "USER": get_env_var("POSTGRES_USER"),
         "PASSWORD": get_env_var("POSTGRES_PASSWORD"),
         "HOST": get_env_var("POSTGRES_HOST"),
-        "PORT": os.getenv("POSTGRES_PORT", "5432"),
+        "PORT": env("POSTGRES_PORT", "5432"),
         "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
         "OPTIONS": {
-            "sslmode": os.getenv("POSTGRES_SSLMODE", "require")
+            "sslmode": env("POSTGRES_SSLMODE", "require")
         },
     }
 }
 
 # ─── Redis: Upstash Direct (used manually, not via CACHES) ──────────────
+# Read and write share one URL, so redis_utils builds a single pool for both clients
 REDIS_URL = get_env_var("REDIS_URL")
-REDIS_READ_URL = get_env_var("REDIS_URL")
-REDIS_WRITE_URL = get_env_var("REDIS_URL")
+REDIS_READ_URL = REDIS_WRITE_URL = REDIS_URL
+REDIS_POOL_SIZE = env("REDIS_POOL_SIZE", 32, int)
+
+# ─── Django REST Framework ──────────────────────────────────────────────
+REST_FRAMEWORK = {
+    # Render Decimal as a JSON number, matching redis_utils._default so prices
+    # have the same type on cache hits and misses
+    "COERCE_DECIMAL_TO_STRING": False,
+    "DEFAULT_RENDERER_CLASSES": [
+        "drf_orjson_renderer.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "drf_orjson_renderer.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
 # ─── Password Validation ────────────────────────────────────────────────
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -99,49 +148,30 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
-from decouple import config, Csv
-import sentry_sdk
-from sentry_sdk.integrations.django import DjangoIntegration
-
 # ─── Sentry Configuration ────────────────────────────────────────────────────
-sentry_sdk.init(
-    dsn=config('SENTRY_DSN'),
-    integrations=[DjangoIntegration()],
-    traces_sample_rate=config('SENTRY_TRACES_SAMPLE_RATE', default=0.0, cast=float),
-    environment=config('ENVIRONMENT', default='development'),
-    release=config('RELEASE', default=None),
-    send_default_pii=True,
-)
+# Initialized lazily in EshopConfig.ready(); skipped for these management commands.
+SENTRY_SKIP_COMMANDS = ("test", "migrate", "makemigrations")
+SENTRY_DSN = get_env_var("SENTRY_DSN")
+SENTRY_TRACES_SAMPLE_RATE = env("SENTRY_TRACES_SAMPLE_RATE", 0.0, float)
+SENTRY_ENVIRONMENT = env("ENVIRONMENT", "development")
+SENTRY_RELEASE = env("RELEASE", None)
 
 # ─── Logging Configuration ─────────────────────────────────────────────────
+# Handlers for the product service logger are built directly in
+# EshopConfig.ready(): request-path code only enqueues records, and a
+# background listener writes them to console and LOG_FILE.
+LOG_FORMAT = "[%(asctime)s] %(levelname)s %(name)s %(message)s"
+
+# Skip thread/process lookups and caller frame walks on every LogRecord;
+# LOG_FORMAT does not use them.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
-    "formatters": {
-        "verbose": {
-            "format": "[{asctime}] {levelname} {name} {message}",
-            "style": "{",
-        },
-    },
-    "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "verbose",
-        },
-        "file": {
-            "class": "logging.FileHandler",
-            "filename": os.path.join(LOG_DIR, "product_service.log"),
-            "formatter": "verbose",
-            "level": "INFO",
-        },
-    },
-    "loggers": {
-        "eshop.services.product_service": {
-            "handlers": ["console", "file"],
-            "level": "INFO",
-            "propagate": False,
-        },
-    },
 }
 
 # ─── Internationalization ───────────────────────────────────────────────
@@ -152,7 +182,7 @@ USE_TZ = True
 
 # ─── Static Files ───────────────────────────────────────────────────────
 STATIC_URL = "/static/"
-STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
+STATIC_ROOT = str(BASE_DIR / "staticfiles")
 
 # ─── Default Primary Key Field ──────────────────────────────────────────
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -12,9 +12,15 @@ class Product(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=200)
     category = models.ForeignKey(Category, on_delete=models.PROTECT, related_name="products")
-    price = models.DecimalField(max_digits=10, decimal_places=2)
+    price = models.DecimalField(max_digits=10, decimal_places=2, db_index=True)
     stock = models.PositiveIntegerField()
     description = models.TextField(blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["category", "price"], name="products_category_price_idx"),
+            models.Index(fields=["category", "name"], name="products_category_name_idx"),
+        ]
+
     def __str__(self):
         return self.name
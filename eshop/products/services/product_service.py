@@ -1,12 +1,21 @@
 import uuid
 import logging
-from django.core.paginator import Paginator, EmptyPage
+import functools
+from decimal import Decimal, InvalidOperation
 from django.db import transaction
 from django.core.exceptions import ValidationError
 from django.http import Http404
 
 from ..models import Product, Category
-from eshop.cache.redis_utils import get_cached, set_cached, invalidate
+from eshop.cache.redis_utils import (
+    get_cached,
+    set_cached,
+    get_many_cached,
+    set_many_cached,
+    set_cached_indexed,
+    invalidate_index,
+    content_etag,
+)
 from eshop.services.metrics import PRODUCT_CACHE, PRODUCT_LATENCY
 from eshop.services.perf import log_timing
 
@@ -14,25 +23,108 @@ logger = logging.getLogger("eshop.services.product_service")
 logger.info("🎉 Product service logger initialized")
 
 LIST_TTL = 600
+COUNT_TTL = 30
+CATEGORY_TTL = 3600
+MAX_BATCH_IDS = 100
+LIST_FIELDS = ("id", "name", "category_id", "price", "stock", "description")
+# The {list} hash tag pins every listing key, and the index, to one cluster slot.
+LIST_KEY_PREFIX = "products:list:{list}:"
+LIST_INDEX_KEY = LIST_KEY_PREFIX + "index"
+
+
+def _filter_key(params):
+    """Build the cache-key fragment identifying the filters applied to a product list."""
+    category = params.get("category", "all")
+    category_id = params.get("category_id", "all")
+    price_min = params.get("price_min", "")
+    price_max = params.get("price_max", "")
+    return f"category={category}:category_id={category_id}:price_min={price_min}:price_max={price_max}"
+
+
+def _price_param(value):
+    """Parse a price filter, rejecting NaN and infinities."""
+    price = Decimal(value)
+    if not price.is_finite():
+        raise ValueError(f"Non-finite price: {value}")
+    return price
 
 
 def _listing_key(params):
     """Build the Redis key for product list caches based on query parameters."""
-    category = params.get("category", "all")
     page = params.get("page", "1")
     page_size = params.get("page_size", "10")
-    return f"products:list:category={category}:page={page}:size={page_size}"
+    after_id = params.get("after_id", "")
+    return f"{LIST_KEY_PREFIX}{_filter_key(params)}:page={page}:size={page_size}:after={after_id}"
+
+
+def _count_key(params):
+    """Build the Redis key for the filtered product count, tracked in the listing index."""
+    return f"{LIST_KEY_PREFIX}count:{_filter_key(params)}"
 
 
 def _detail_key(pk):
     """Build the Redis key for a single-product cache entry."""
-    return f"products:detail:{pk}"
+    return f"products:detail:v2:{pk}"
+
+
+def _detail_entry(obj):
+    """Wrap a product dict with the ETag of its contents for the detail cache."""
+    return {"etag": content_etag(obj), "data": obj}
+
+
+def _category_key(name):
+    """Build the Redis key mapping a category name to its id."""
+    return f"category:name:{name}"
+
+
+def _category_id_by_name(name):
+    """
+    Resolve a category name to its id, caching the mapping in Redis.
+    Returns None if no category with that name exists.
+    """
+    key = _category_key(name)
+    cached = get_cached(key)
+    if cached:
+        return cached
+
+    cat_id = Category.objects.filter(name=name).values_list("id", flat=True).first()
+    if cat_id is None:
+        return None
+
+    _cache_category_id_on_commit(name, cat_id)
+    return cat_id
+
+
+def _cache_category_id_on_commit(name, cat_id):
+    """
+    Cache the name-to-id mapping once the current transaction commits, so a
+    rolled-back transaction never leaves an id for a category that doesn't exist.
+    """
+    transaction.on_commit(
+        functools.partial(set_cached, _category_key(name), cat_id, ex=CATEGORY_TTL)
+    )
+
+
+def _get_or_create_category_id(name):
+    """
+    Resolve a category name to its id for writes, creating the category if missing.
+    Uses the Redis name-to-id mapping before falling back to get_or_create.
+    """
+    cached = get_cached(_category_key(name))
+    if cached:
+        return cached
+
+    category_obj, _ = Category.objects.get_or_create(name=name)
+    _cache_category_id_on_commit(name, category_obj.id)
+    return category_obj.id
 
 
 @log_timing
 def list_products(params):
     """
     Retrieve a paginated list of products, applying optional filters, and cache the result.
+    Pages are sliced with LIMIT/OFFSET, or by keyset after 'after_id' for deep scrolling;
+    the filtered count is cached briefly so misses don't re-run COUNT(*).
     Returns a tuple (result_dict, cache_hit: bool).
     """
     try:
@@ -42,46 +134,53 @@ def list_products(params):
             return cached, True
 
         qs = Product.objects.all()
-        if "category" in params:
-            qs = qs.filter(category__name=params["category"])
+        if "category_id" in params:
+            qs = qs.filter(category_id=uuid.UUID(params["category_id"]))
+        elif "category" in params:
+            cat_id = _category_id_by_name(params["category"])
+            qs = qs.filter(category_id=cat_id) if cat_id else qs.none()
+        if "price_min" in params:
+            qs = qs.filter(price__gte=_price_param(params["price_min"]))
+        if "price_max" in params:
+            qs = qs.filter(price__lte=_price_param(params["price_max"]))
 
         page = int(params.get("page", 1))
         page_size = int(params.get("page_size", 10))
-        paginator = Paginator(qs.values(), page_size)
-
-        try:
-            page_obj = paginator.get_page(page)
-        except EmptyPage:
+        if page < 1 or page_size < 1:
             raise ValidationError("Invalid page number.")
 
-        product_list = []
-        for obj in page_obj:
-            record = {
-                k: str(v) if isinstance(v, uuid.UUID) else v
-                for k, v in obj.items()
-            }
-            product_list.append(record)
-
-        if "price_min" in params:
-            min_price = float(params["price_min"])
-            product_list = [p for p in product_list if float(p["price"]) >= min_price]
-
-        if "price_max" in params:
-            max_price = float(params["price_max"])
-            product_list = [p for p in product_list if float(p["price"]) <= max_price]
+        count_key = _count_key(params)
+        count = get_cached(count_key)
+        if count is None:
+            count = qs.count()
+            # Keep the index alive for the full LIST_TTL of the pages it also tracks
+            set_cached_indexed(
+                count_key, count, ex=COUNT_TTL, index_set=LIST_INDEX_KEY, index_ex=LIST_TTL
+            )
+
+        rows = qs.values(*LIST_FIELDS).order_by("id")
+        if "after_id" in params:
+            rows = rows.filter(id__gt=uuid.UUID(params["after_id"]))[:page_size]
+        else:
+            start = (page - 1) * page_size
+            rows = rows[start:start + page_size]
+        product_list = list(rows)
 
         result = {
             "results": product_list,
-            "count": paginator.count,
-            "total_pages": paginator.num_pages,
+            "count": count,
+            "total_pages": max(1, -(-count // page_size)),
             "page": page,
             "page_size": page_size,
+            "next_after_id": product_list[-1]["id"] if len(product_list) == page_size else None,
         }
 
-        set_cached(key, result, ex=LIST_TTL)
+        set_cached_indexed(key, result, ex=LIST_TTL, index_set=LIST_INDEX_KEY)
         return result, False
 
-    except (ValueError, TypeError) as e:
+    except ValidationError:
+        raise
+    except (ValueError, TypeError, InvalidOperation) as e:
         logger.error(f"Invalid parameter in list_products: {e}")
         raise ValidationError("Invalid query parameters.")
     except Exception as e:
@@ -92,7 +191,8 @@ def list_products(params):
 @log_timing
 def get_product_by_id(pk):
     """
-    Retrieve a single product by primary key, cache its serialized dict, and return (data, cache_hit).
+    Retrieve a single product by primary key, cache its serialized dict, and return (entry, cache_hit).
+    The entry is {"etag": ..., "data": {...}}; the ETag is computed once when the entry is cached.
     If not found, returns (None, False).
     """
     try:
@@ -109,8 +209,9 @@ def get_product_by_id(pk):
             if isinstance(value, uuid.UUID):
                 obj[field] = str(value)
 
-        set_cached(key, obj, None)
-        return obj, False
+        entry = _detail_entry(obj)
+        set_cached(key, entry, None)
+        return entry, False
 
     except Http404 as e:
         logger.warning(e)
@@ -120,10 +221,37 @@ def get_product_by_id(pk):
         return None, False
 
 
-def _invalidate_listings():
-    """Invalidate all cached product-list keys."""
+@log_timing
+def get_products_by_ids(pks):
+    """
+    Retrieve several products by primary key with one cache MGET, falling back to a
+    single DB query for the misses and caching those in one pipeline.
+    Returns (list of found products in request order, cache_hit: bool for all-hit).
+    """
+    if len(pks) > MAX_BATCH_IDS:
+        raise ValidationError(f"At most {MAX_BATCH_IDS} ids may be requested at once.")
     try:
-        invalidate("products:list:*")
+        pks = [str(uuid.UUID(str(pk))) for pk in pks]
+    except ValueError:
+        raise ValidationError("Invalid product id.")
+
+    cached = get_many_cached([_detail_key(pk) for pk in pks]) or [None] * len(pks)
+    found = {pk: entry["data"] for pk, entry in zip(pks, cached) if entry}
+
+    misses = [pk for pk in pks if pk not in found]
+    if misses:
+        rows = {str(row["id"]): row for row in Product.objects.filter(pk__in=misses).values()}
+        if rows:
+            set_many_cached({_detail_key(pk): _detail_entry(row) for pk, row in rows.items()})
+        found.update(rows)
+
+    return [found[pk] for pk in pks if pk in found], not misses
+
+
+def _invalidate_listings(*keys):
+    """Invalidate all cached product-list keys tracked in the listing index, plus any extra keys."""
+    try:
+        invalidate_index(LIST_INDEX_KEY, *keys)
     except Exception as e:
         logger.warning("Could not invalidate listings cache: %s", e)
 
@@ -135,8 +263,7 @@ def create_product(payload):
     """
     try:
         category_name = payload.pop("category")
-        category_obj, _ = Category.objects.get_or_create(name=category_name)
-        payload["category"] = category_obj
+        payload["category_id"] = _get_or_create_category_id(category_name)
         return Product.objects.create(**payload)
     except Exception as e:
         logger.exception("Error creating product: %s", e)
@@ -148,24 +275,24 @@ def update_product(pk, data):
     """
     Update an existing Product by primary key with given data dict.
     If 'category' is present, it's treated as a category-name and get_or_created.
-    Returns (updated Product instance, cache_hit=False).
+    Returns (dict of the updated fields keyed like the API output, cache_hit=False)
+    without re-reading the row.
     """
     with transaction.atomic():
         if "category" in data:
             cat_name = data.pop("category")
-            category_obj, _ = Category.objects.get_or_create(name=cat_name)
-            data["category"] = category_obj
+            data["category_id"] = _get_or_create_category_id(cat_name)
 
         updated_count = Product.objects.filter(pk=pk).update(**data)
         if updated_count == 0:
             raise Http404(f"Product with id {pk} not found")
 
-        invalidate(_detail_key(pk))
-        _invalidate_listings()
-
-        product = Product.objects.get(pk=pk)
+        _invalidate_listings(_detail_key(pk))
 
-    return product, False
+    updated = {"id": pk, **{k: v for k, v in data.items() if k != "category_id"}}
+    if "category_id" in data:
+        updated["category"] = data["category_id"]
+    return updated, False
 
 
 @log_timing
@@ -181,7 +308,6 @@ def delete_product(pk):
             raise Http404(f"Product with id {pk} not found")
 
         product.delete()
-        invalidate(_detail_key(pk))
-        _invalidate_listings()
+        _invalidate_listings(_detail_key(pk))
 
     return None, False
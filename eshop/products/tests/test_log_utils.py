@@ -0,0 +1,91 @@
+import os
+import time
+import logging
+import tempfile
+from unittest import mock
+from django.test import TestCase
+from eshop.log_utils import AppendHandler, LogFileHandler, TimedMemoryHandler
+
+
+def make_record(level, msg):
+    return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+
+class TimedMemoryHandlerTest(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "app.log")
+        self.target = LogFileHandler(self.path, delay=True)
+        self.target.setFormatter(logging.Formatter("%(message)s"))
+        self.addCleanup(self.target.close)
+
+    def make_handler(self, flush_interval=60):
+        handler = TimedMemoryHandler(10, target=self.target, flush_interval=flush_interval)
+        self.addCleanup(handler.close)
+        return handler
+
+    def read_log(self):
+        if not os.path.exists(self.path):
+            return ""
+        with open(self.path) as f:
+            return f.read()
+
+    def test_info_records_are_buffered(self):
+        handler = self.make_handler()
+        handler.handle(make_record(logging.INFO, "one"))
+        handler.handle(make_record(logging.INFO, "two"))
+        self.assertEqual(self.read_log(), "")
+        self.assertEqual(len(handler.buffer), 2)
+
+    def test_error_flushes_buffer_in_one_batch(self):
+        handler = self.make_handler()
+        with mock.patch.object(self.target, "write_batch", wraps=self.target.write_batch) as write_batch:
+            handler.handle(make_record(logging.INFO, "one"))
+            handler.handle(make_record(logging.INFO, "two"))
+            handler.handle(make_record(logging.ERROR, "boom"))
+        write_batch.assert_called_once()
+        self.assertEqual(self.read_log(), "one\ntwo\nboom\n")
+        self.assertEqual(handler.buffer, [])
+
+    def test_timed_flush(self):
+        handler = self.make_handler(flush_interval=0.05)
+        handler.handle(make_record(logging.INFO, "tick"))
+        deadline = time.monotonic() + 2
+        while not self.read_log() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.read_log(), "tick\n")
+
+
+class AppendHandlerTest(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "logs", "app.log")
+        self.handler = AppendHandler(self.path)
+        self.handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        self.addCleanup(self.handler.close)
+
+    def read_log(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def test_creates_directory_and_file_lazily(self):
+        self.assertFalse(os.path.exists(os.path.dirname(self.path)))
+        self.handler.handle(make_record(logging.INFO, "first"))
+        self.assertEqual(self.read_log(), b"INFO first\n")
+
+    def test_write_batch_writes_formatted_lines(self):
+        self.handler.write_batch([
+            make_record(logging.INFO, "one"),
+            make_record(logging.ERROR, "two"),
+        ])
+        self.assertEqual(self.read_log(), b"INFO one\nERROR two\n")
+
+    def test_close_releases_descriptor(self):
+        self.handler.handle(make_record(logging.INFO, "first"))
+        fd = self.handler._fd
+        self.handler.close()
+        self.assertIsNone(self.handler._fd)
+        with self.assertRaises(OSError):
+            os.fstat(fd)
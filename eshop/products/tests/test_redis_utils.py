@@ -1,5 +1,8 @@
 from django.test import TestCase
-from eshop.cache.redis_utils import set_cached, get_cached, invalidate
+from eshop.cache.redis_utils import (
+    SingletonRedisClient, set_cached, get_cached, invalidate,
+    set_cached_indexed, invalidate_index,
+)
 
 class RedisUtilsTest(TestCase):
     def test_set_and_get_cached(self):
@@ -19,3 +22,35 @@ class RedisUtilsTest(TestCase):
         self.assertGreaterEqual(deleted_count, 1)
 
         self.assertIsNone(get_cached(key))
+
+    def test_invalidate_index(self):
+        index = "test:index"
+        set_cached_indexed("test:indexed:1", {"x": 1}, ex=10, index_set=index)
+        set_cached_indexed("test:indexed:2", {"x": 2}, ex=10, index_set=index)
+        deleted_count = invalidate_index(index)
+        self.assertEqual(deleted_count, 2)
+
+        self.assertIsNone(get_cached("test:indexed:1"))
+        self.assertIsNone(get_cached("test:indexed:2"))
+
+    def test_small_payload_stored_uncompressed(self):
+        key = "test:format:small"
+        value = {"name": "RedisBook", "tags": ["a", "b"]}
+        set_cached(key, value, ex=10)
+        raw = SingletonRedisClient("write").get_client().get(key)
+        self.assertTrue(raw.startswith(b"j\x01"))
+        self.assertEqual(get_cached(key), value)
+
+    def test_large_payload_stored_compressed(self):
+        key = "test:format:large"
+        value = {"description": "x" * 2048}
+        set_cached(key, value, ex=10)
+        raw = SingletonRedisClient("write").get_client().get(key)
+        self.assertTrue(raw.startswith(b"z\x01"))
+        self.assertLess(len(raw), 2048)
+        self.assertEqual(get_cached(key), value)
+
+    def test_legacy_untagged_json(self):
+        key = "test:format:legacy"
+        SingletonRedisClient("write").get_client().set(key, '{"name": "Legacy"}', ex=10)
+        self.assertEqual(get_cached(key), {"name": "Legacy"})
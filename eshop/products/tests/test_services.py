@@ -1,7 +1,10 @@
+from unittest import mock
+from django.core.exceptions import ValidationError
 from django.test import TestCase
 from products.models import Product, Category
+from products.services import product_service
 from products.services.product_service import (
-    list_products, get_product_by_id,
+    list_products, get_product_by_id, get_products_by_ids,
     create_product, update_product, delete_product
 )
 
@@ -18,16 +21,44 @@ class ProductServiceTest(TestCase):
         )
 
     def test_get_product_by_id(self):
-        data, cache_hit = get_product_by_id(self.product.pk)
-        self.assertEqual(data["name"], self.product.name)
+        entry, cache_hit = get_product_by_id(self.product.pk)
+        self.assertEqual(entry["data"]["name"], self.product.name)
+        self.assertTrue(entry["etag"])
         self.assertFalse(cache_hit)
 
+    def test_get_products_by_ids(self):
+        data, cache_hit = get_products_by_ids([str(self.product.pk)])
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["name"], self.product.name)
+
     def test_list_products(self):
         params = {"category": "Books", "page": "1", "page_size": "10"}
         data, cache_hit = list_products(params)
         self.assertEqual(data["results"][0]["name"], self.product.name)
         self.assertFalse(cache_hit)
 
+    def test_list_products_price_filter(self):
+        for price in (50, 100, 150, 250):
+            Product.objects.create(
+                name=f"Book {price}", price=price, stock=1, category=self.category
+            )
+        params = {"price_min": "100", "price_max": "200", "page": "1", "page_size": "2"}
+        data, cache_hit = list_products(params)
+        self.assertEqual(len(data["results"]), 2)
+        self.assertEqual(data["count"], 3)
+
+    def test_list_products_invalid_params(self):
+        with mock.patch.object(product_service.logger, "exception") as log_exception:
+            for params in (
+                {"after_id": "not-a-uuid"},
+                {"category_id": "not-a-uuid"},
+                {"price_max": "NaN"},
+                {"page": "0"},
+            ):
+                with self.assertRaises(ValidationError):
+                    list_products(params)
+        log_exception.assert_not_called()
+
     def test_create_product(self):
         payload = {
             "name": "Book 2",
@@ -49,7 +80,7 @@ class ProductServiceTest(TestCase):
             "category": "Books"
         }
         updated_product, cache_hit = update_product(self.product.pk, updated_data)
-        self.assertEqual(updated_product.name, "Book 1 Updated")
+        self.assertEqual(updated_product["name"], "Book 1 Updated")
 
     def test_delete_product(self):
         delete_product(self.product.pk)
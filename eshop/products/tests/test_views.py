@@ -1,6 +1,8 @@
 from rest_framework.test import APITestCase
 from django.urls import reverse
 from products.models import Product, Category
+from products.services.product_service import LIST_INDEX_KEY
+from eshop.cache.redis_utils import invalidate_index
 
 
 class ProductAPITest(APITestCase):
@@ -21,12 +23,36 @@ class ProductAPITest(APITestCase):
         response = self.client.get(url, {"page": 1})
         self.assertEqual(response.status_code, 200)
 
+    def test_list_price_type_matches_on_cache_hit(self):
+        invalidate_index(LIST_INDEX_KEY)
+        url = reverse("product-list")
+        miss = self.client.get(url, {"page": 1}).json()
+        hit = self.client.get(url, {"page": 1}).json()
+        self.assertFalse(miss["cache_hit"])
+        self.assertTrue(hit["cache_hit"])
+        miss_price = miss["data"]["results"][0]["price"]
+        hit_price = hit["data"]["results"][0]["price"]
+        self.assertIs(type(miss_price), type(hit_price))
+        self.assertIsInstance(hit_price, float)
+
     def test_get_product(self):
         url = reverse("product-detail", args=[self.product.id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["data"]["name"], "Book A")
 
+    def test_get_product_not_modified(self):
+        url = reverse("product-detail", args=[self.product.id])
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_batch_products(self):
+        url = reverse("product-batch")
+        response = self.client.get(url, {"ids": str(self.product.id)})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["data"][0]["name"], "Book A")
+
     def test_create_product(self):
         url = reverse("product-list")
         payload = {
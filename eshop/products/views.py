@@ -8,6 +8,7 @@ from django.core.exceptions import ValidationError
 from django.http import Http404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from .models import Product
@@ -16,6 +17,7 @@ from .filters import ProductFilter
 from .services.product_service import (
     list_products,
     get_product_by_id,
+    get_products_by_ids,
     create_product,
     update_product,
     delete_product,
@@ -23,6 +25,8 @@ from .services.product_service import (
 
 logger = logging.getLogger(__name__)
 
+DETAIL_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=600"
+
 
 class ProductViewSet(viewsets.ModelViewSet):
     """
@@ -30,6 +34,7 @@ class ProductViewSet(viewsets.ModelViewSet):
 
     list:        GET  /products/           → paginated list, Redis-cached  
     retrieve:    GET  /products/{id}/      → single item, Redis-cached  
+    batch:       GET  /products/batch/     → several items by ?ids=, one Redis MGET  
     create:      POST /products/           → create with category by name  
     update:      PUT  /products/{id}/      → full replace with category by name  
     destroy:     DELETE /products/{id}/    → delete and invalidate cache  
@@ -66,15 +71,23 @@ class ProductViewSet(viewsets.ModelViewSet):
         GET /products/{id}/
         Returns a single product detail, fetching from cache if available.
         Response JSON: { data: {...}, cache_hit: bool } or 404 if not found.
+        Sends a weak ETag and answers 304 Not Modified when If-None-Match matches it.
         """
         try:
             pk = kwargs.get("pk")
-            data, cache_hit = get_product_by_id(pk)
-            if not data:
+            entry, cache_hit = get_product_by_id(pk)
+            if not entry:
                 return Response({"detail": "Product not found."},
                                 status=status.HTTP_200_OK)
-            return Response({"data": data, "cache_hit": cache_hit},
-                            status=status.HTTP_200_OK)
+
+            etag = f'W/"{entry["etag"]}"'
+            headers = {"ETag": etag, "Cache-Control": DETAIL_CACHE_CONTROL}
+            if_none_match = request.headers.get("If-None-Match", "")
+            if if_none_match.strip() == "*" or etag in (t.strip() for t in if_none_match.split(",")):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+            return Response({"data": entry["data"], "cache_hit": cache_hit},
+                            status=status.HTTP_200_OK, headers=headers)
         except Http404 as e:
             logger.warning("Product not found: %s", e)
             return Response({"detail": str(e)},
@@ -84,6 +97,28 @@ class ProductViewSet(viewsets.ModelViewSet):
             return Response({"detail": "Failed to retrieve product due to server error."},
                             status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @action(detail=False, methods=["get"], url_path="batch")
+    def batch(self, request, *args, **kwargs):
+        """
+        GET /products/batch/?ids=<id>,<id>,...
+        Returns the requested products in one round-trip, fetching misses from DB.
+        Response JSON: { data: [...], cache_hit: bool }.
+        """
+        try:
+            ids = request.query_params.get("ids", "")
+            pks = [pk for pk in ids.split(",") if pk]
+            data, cache_hit = get_products_by_ids(pks)
+            return Response({"data": data, "cache_hit": cache_hit},
+                            status=status.HTTP_200_OK)
+        except ValidationError as ve:
+            logger.warning("Validation error in batch: %s", ve)
+            return Response({"detail": str(ve)},
+                            status=status.HTTP_400_BAD_REQUEST)
+        except Exception:
+            logger.exception("Internal error in get_products_by_ids")
+            return Response({"detail": "Failed to retrieve products due to server error."},
+                            status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
     def create(self, request, *args, **kwargs):
         """
         POST /products/
@@ -91,22 +126,28 @@ class ProductViewSet(viewsets.ModelViewSet):
         which will be get_or_created in the service layer.
         """
         try:
-            data = request.data.copy()
-            category_name = data.get("category")
+            category_name = request.data.get("category")
             if not category_name:
                 raise ValidationError("The 'category' field is required.")
 
-            data_for_serializer = data.copy()
-            data_for_serializer.pop("category", None)
-
-            serializer = self.get_serializer(data=data_for_serializer)
+            data = {k: v for k, v in request.data.items() if k != "category"}
+            serializer = self.get_serializer(data=data)
             serializer.is_valid(raise_exception=True)
 
             payload = serializer.validated_data.copy()
             payload["category"] = category_name
 
             product = create_product(payload)
-            output = self.get_serializer(product).data
+            if product is None:
+                raise RuntimeError("Product could not be created.")
+
+            # Build the response from the validated input instead of re-serializing the instance
+            output = {
+                "id": product.id,
+                **serializer.validated_data,
+                "description": product.description,
+                "category": product.category_id,
+            }
             return Response(output, status=status.HTTP_201_CREATED)
         except ValidationError as ve:
             logger.warning("Validation failed in create: %s", ve)
@@ -151,7 +192,7 @@ class ProductViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-        return Response(self.get_serializer(updated_product).data,
+        return Response(updated_product,
                         status=status.HTTP_200_OK)
 
     def destroy(self, request, *args, **kwargs):